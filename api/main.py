@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+import asyncio
+import importlib
+import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from types import ModuleType
+from typing import Dict, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import Response
 from pydantic import BaseModel
 from pydantic_settings import BaseSettings
 
@@ -35,16 +39,47 @@ class RebuildResponse(BaseModel):
 settings = Settings()
 app = FastAPI(title="VOC Report API", version="0.1.0")
 
+# Validated report bytes keyed by path, invalidated when mtime/size change.
+_REPORT_CACHE: Dict[Path, Tuple[int, int, bytes]] = {}
 
-def read_report(path: Path) -> Dict[str, Any]:
+
+def read_report_bytes(path: Path) -> Tuple[str, bytes]:
+    """Returns ``(etag, bytes)`` for the report, both from one cache entry.
+
+    The ETag is derived from the file's mtime and size.
+    """
     if not path.exists():
         raise HTTPException(status_code=404, detail=f"Report file not found: {path}")
 
+    stat = path.stat()
+    cached = _REPORT_CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return report_etag(*cached[:2]), cached[2]
+
+    raw = path.read_bytes()
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        orjson.loads(raw)
+    except orjson.JSONDecodeError as exc:
         raise HTTPException(status_code=500, detail=f"Invalid JSON report: {exc}") from exc
 
+    _REPORT_CACHE[path] = (stat.st_mtime_ns, stat.st_size, raw)
+    return report_etag(stat.st_mtime_ns, stat.st_size), raw
+
+
+def report_etag(mtime_ns: int, size: int) -> str:
+    return f'"{mtime_ns:x}-{size:x}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110): any listed tag, W/ or *."""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
 
 @app.get("/health")
 def health() -> Dict[str, str]:
@@ -52,26 +87,51 @@ def health() -> Dict[str, str]:
 
 
 @app.get("/report")
-def get_report() -> JSONResponse:
-    payload = read_report(settings.report_path)
-    return JSONResponse(content=payload)
+def get_report(request: Request) -> Response:
+    etag, content = read_report_bytes(settings.report_path)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
 
+    # The file is already JSON, so serve it as-is instead of re-encoding.
+    return Response(content=content, media_type="application/json", headers={"ETag": etag})
 
-@app.post("/report/rebuild", response_model=RebuildResponse)
-def rebuild_report() -> RebuildResponse:
-    analyzer = settings.analyzer_path
-    if not analyzer.exists():
-        raise HTTPException(status_code=500, detail=f"Analyzer script not found: {analyzer}")
 
+def load_analyzer(path: Path) -> ModuleType:
+    """Imports the analyzer script as a module (cached after the first call)."""
+    if not path.exists():
+        raise HTTPException(status_code=500, detail=f"Analyzer script not found: {path}")
+
+    analyzer_dir = str(path.parent)
+    if analyzer_dir not in sys.path:
+        sys.path.insert(0, analyzer_dir)
+    try:
+        return importlib.import_module(path.stem)
+    except ImportError as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to import analyzer: {exc}") from exc
+
+
+# Serialises rebuilds: the analyzer's cached Google clients share one
+# (non-thread-safe) httplib2 connection, and each rebuild rewrites the
+# Sheets cache and report files.
+_REBUILD_LOCK = threading.Lock()
+
+
+def run_rebuild() -> None:
+    """Imports the analyzer and exports the report, one rebuild at a time."""
+    with _REBUILD_LOCK:
+        analyzer = load_analyzer(settings.analyzer_path)
+        analyzer.run_export(settings.report_path)
+
+
+@app.post("/report/rebuild", response_model=RebuildResponse)
+async def rebuild_report() -> RebuildResponse:
+    # Run in a worker thread (including the first, heavy analyzer import) so
+    # the event loop keeps serving other requests.
     try:
-        subprocess.run(
-            ["python3", str(analyzer), "--export-report"],
-            cwd=analyzer.parent,
-            check=True,
-        )
-    except subprocess.CalledProcessError as exc:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to rebuild report (exit code {exc.returncode})"
-        ) from exc
+        await asyncio.to_thread(run_rebuild)
+    except HTTPException:
+        raise
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Failed to rebuild report: {exc}") from exc
 
     return RebuildResponse(message="Report rebuilt successfully", report_path=settings.report_path)
@@ -7,52 +7,132 @@ confirm OAuth and column mappings before wiring the rest of the pipeline.
 from __future__ import annotations
 
 import argparse
+from collections import Counter
+import functools
+import itertools
 import json
 import os
 from pathlib import Path
 import re
-from datetime import datetime, timezone
-from typing import Dict, List, Optional, Tuple, Any
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any
 
+import numpy as np
+import orjson
 import pandas as pd
-from dotenv import load_dotenv
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+
+# Google client and dotenv imports are deferred to the functions that use
+# them so importing this module (e.g. from the API) stays cheap.
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from google.oauth2.credentials import Credentials
 
 try:
     from zoneinfo import ZoneInfo
 except ImportError:  # pragma: no cover - Python < 3.9
     from backports.zoneinfo import ZoneInfo  # type: ignore
 
-# Read-only scope is enough for our analytics use-case.
-SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+# Free-text columns use Arrow-backed strings when pyarrow is available.
+try:
+    import pyarrow  # noqa: F401
+
+    TEXT_DTYPE = "string[pyarrow]"
+except ImportError:  # pragma: no cover - optional dependency
+    TEXT_DTYPE = "string"
+
+# Read-only scope is enough for our analytics use-case. Drive metadata lets
+# us check the spreadsheet's modifiedTime before re-reading it.
+DRIVE_METADATA_SCOPE = "https://www.googleapis.com/auth/drive.metadata.readonly"
+SCOPES = [
+    "https://www.googleapis.com/auth/spreadsheets.readonly",
+    DRIVE_METADATA_SCOPE,
+]
 
 ROOT_DIR = Path(__file__).resolve().parent
 DEFAULT_ENV_PATH = ROOT_DIR / ".env"
 DEFAULT_CREDENTIALS_PATH = ROOT_DIR / "credentials.json"
 DEFAULT_TOKEN_PATH = ROOT_DIR / "token.json"
 DEFAULT_REPORT_PATH = ROOT_DIR / "voc_report.json"
+SHEETS_CACHE_PATH = ROOT_DIR / "voc_cache.json"
+SHEETS_CACHE_META_PATH = ROOT_DIR / "voc_cache.meta.json"
+
+# Retries for transient Sheets errors (429/5xx); the client backs off
+# exponentially with jitter between attempts.
+SHEETS_NUM_RETRIES = 5
+
+# Whole-column ranges on larger sheets are fetched in row chunks of this size.
+SHEETS_CHUNK_ROWS = 50_000
+_COLUMN_RANGE_RE = re.compile(r"^(?P<sheet>.+)!(?P<first>[A-Za-z]+):(?P<last>[A-Za-z]+)$")
+_A1_COLUMNS_RE = re.compile(r"!(?P<first>[A-Za-z]+)\d*:(?P<last>[A-Za-z]+)\d*$")
+_A1_ROWS_RE = re.compile(r"![A-Za-z]*(?P<first>\d+):[A-Za-z]*(?P<last>\d+)$")
+
+# Candidate created_at formats, tried in order after normalisation.
+CREATED_AT_FORMATS = (
+    "%Y-%m-%d %p %I:%M:%S",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d",
+)
+
+_DOT_RE = re.compile(r"\.\s*")
+_WS_RE = re.compile(r"\s+")
+_SEOUL_TZ = ZoneInfo("Asia/Seoul")
+
+NS_PER_DAY = 86_400 * 10**9
+# Asia/Seoul has no DST, so KST wall-clock time is always UTC+09:00.
+KST_OFFSET_NS = 9 * 3_600 * 10**9
+NAT_NS = np.iinfo(np.int64).min
+
+# Category keywords per learning phase, checked in priority order.
+CATEGORY_PHASE_RULES = (
+    ("준비", ("장비", "기기", "환경")),
+    ("진행", ("수업", "커리큘럼", "멘토")),
+    ("지원", ("지원",)),
+    ("행정", ("장려금", "행정", "출석")),
+)
+_CATEGORY_PHASE_PATTERNS = [
+    (re.compile("|".join(map(re.escape, keywords))), phase)
+    for phase, keywords in CATEGORY_PHASE_RULES
+]
+
+# Row-level phase heuristics over the joined text columns, checked in order.
+PHASE_TEXT_COLUMNS = ("category", "subcategory", "content_text", "content")
+PHASE_PATTERNS = [
+    (re.compile(r"(?:장비|노트북|맥북|사양|대여|반납|주변기기|모니터|마우스|키보드)"), "학습 준비"),
+    (re.compile(r"(?:플랫폼|실습|콘솔|빌드|로그인|접속|출결|qr|오류|강의실)"), "학습 진행"),
+    (re.compile(r"(?:장려금|지원금|지급|자격|증빙|정산)"), "학습 지원"),
+    (re.compile(r"(?:수강 변경|휴가|공가|행정|신청|증명서|환불|이관|출석)"), "행정 처리"),
+]
+DEFAULT_PHASE = "학습 진행"
 
 
 def load_environment() -> None:
     """Loads environment variables from .env if present."""
+    from dotenv import load_dotenv
+
     if DEFAULT_ENV_PATH.exists():
         load_dotenv(DEFAULT_ENV_PATH, override=False)
     else:
         load_dotenv(override=False)
 
 
+@functools.lru_cache(maxsize=4)
 def get_credentials(
     credentials_path: Path = DEFAULT_CREDENTIALS_PATH,
     token_path: Path = DEFAULT_TOKEN_PATH,
 ) -> Credentials:
-    """Fetches (or refreshes) OAuth credentials for Google Sheets API."""
+    """Fetches (or refreshes) OAuth credentials for Google Sheets API.
+
+    Cached per (credentials_path, token_path); the HTTP transport refreshes
+    expired access tokens on its own after that.
+    """
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     creds: Optional[Credentials] = None
 
     if token_path.exists():
-        creds = Credentials.from_authorized_user_file(str(token_path), SCOPES)
+        # Keep the scopes the token was granted: tokens from before the Drive
+        # metadata scope still read Sheets, they just skip the local cache.
+        creds = Credentials.from_authorized_user_file(str(token_path))
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -75,10 +155,183 @@ def get_credentials(
     return creds
 
 
-def fetch_raw_data(limit: Optional[int] = None) -> pd.DataFrame:
-    """Fetches raw VOC rows from Google Sheets into a DataFrame."""
+@functools.lru_cache(maxsize=1)
+def get_sheets_service():
+    """Returns a Sheets API client, built once per process and reused.
+
+    The bundled (static) discovery document avoids a discovery fetch, and the
+    client's authorized httplib2 connection is kept alive between calls.
+    """
+    from googleapiclient.discovery import build
+
+    return build(
+        "sheets",
+        "v4",
+        credentials=get_credentials(),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def get_drive_service():
+    """Returns a Drive API client used for spreadsheet metadata lookups."""
+    from googleapiclient.discovery import build
+
+    return build(
+        "drive",
+        "v3",
+        credentials=get_credentials(),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+def get_spreadsheet_modified_time(spreadsheet_id: str) -> Optional[str]:
+    """Returns the spreadsheet's Drive modifiedTime, or None if unavailable."""
+    from googleapiclient.errors import HttpError
+
+    if not get_credentials().has_scopes([DRIVE_METADATA_SCOPE]):
+        return None
+    try:
+        metadata = (
+            get_drive_service()
+            .files()
+            .get(fileId=spreadsheet_id, fields="modifiedTime", supportsAllDrives=True)
+            .execute(num_retries=SHEETS_NUM_RETRIES)
+        )
+    except HttpError:
+        return None
+    return metadata.get("modifiedTime")
+
+
+def load_cached_rows(cache_key: Dict[str, Any]) -> Optional[List[List[Any]]]:
+    """Returns the cached raw sheet values if saved under ``cache_key``."""
+    if not (SHEETS_CACHE_PATH.exists() and SHEETS_CACHE_META_PATH.exists()):
+        return None
+    try:
+        if json.loads(SHEETS_CACHE_META_PATH.read_text(encoding="utf-8")) != cache_key:
+            return None
+        values = orjson.loads(SHEETS_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):  # unreadable cache: fall back to the API
+        return None
+    return values if isinstance(values, list) else None
+
+
+def save_cached_rows(values: List[List[Any]], cache_key: Dict[str, Any]) -> None:
+    """Stores raw sheet values on disk together with the key they are valid for.
+
+    Only the untouched API values are cached, so changes to the parsing in
+    standardise_columns apply to cached sheets too.
+    """
+    # Drop the key first so a half-written file is never treated as valid.
+    SHEETS_CACHE_META_PATH.unlink(missing_ok=True)
+    SHEETS_CACHE_PATH.write_bytes(orjson.dumps(values))
+    SHEETS_CACHE_META_PATH.write_text(
+        json.dumps(cache_key, ensure_ascii=False), encoding="utf-8"
+    )
+
+
+def get_sheet_ranges() -> List[str]:
+    """Returns the A1 ranges to read, e.g. only the columns the report uses.
+
+    ``GOOGLE_SHEETS_RANGES`` takes a comma-separated list of column ranges on
+    the same rows (``raw data!K:K,raw data!O:O``); otherwise the single
+    ``GOOGLE_SHEETS_RANGE`` is used.
+    """
+    ranges = os.environ.get("GOOGLE_SHEETS_RANGES", "")
+    parsed = [item.strip() for item in ranges.split(",") if item.strip()]
+    return parsed or [os.environ.get("GOOGLE_SHEETS_RANGE", "raw data!K:S")]
+
+
+def get_sheet_row_counts(service, spreadsheet_id: str) -> Dict[str, int]:
+    """Returns the grid row count of every sheet, keyed by title."""
+    metadata = (
+        service.spreadsheets()
+        .get(
+            spreadsheetId=spreadsheet_id,
+            fields="sheets.properties(title,gridProperties.rowCount)",
+        )
+        .execute(num_retries=SHEETS_NUM_RETRIES)
+    )
+    return {
+        sheet["properties"]["title"]: sheet["properties"]
+        .get("gridProperties", {})
+        .get("rowCount", 0)
+        for sheet in metadata.get("sheets", [])
+        if "title" in sheet.get("properties", {})
+    }
+
+
+def split_sheet_range(range_name: str, row_counts: Dict[str, int]) -> List[str]:
+    """Splits a whole-column range such as ``raw data!K:S`` into row chunks."""
+    match = _COLUMN_RANGE_RE.match(range_name)
+    if not match:
+        return [range_name]
+
+    row_count = row_counts.get(match["sheet"].strip("'"))
+    if not row_count or row_count <= SHEETS_CHUNK_ROWS:
+        return [range_name]
+
+    return [
+        f"{match['sheet']}!{match['first']}{start}:"
+        f"{match['last']}{min(start + SHEETS_CHUNK_ROWS - 1, row_count)}"
+        for start in range(1, row_count + 1, SHEETS_CHUNK_ROWS)
+    ]
+
+
+def column_number(letters: str) -> int:
+    """Converts A1 column letters to a 1-based column number (A -> 1)."""
+    number = 0
+    for char in letters.upper():
+        number = number * 26 + ord(char) - ord("A") + 1
+    return number
+
+
+def range_width(range_name: str) -> Optional[int]:
+    """Returns how many columns an A1 range spans, if it can be parsed."""
+    match = _A1_COLUMNS_RE.search(range_name)
+    if not match:
+        return None
+    return column_number(match["last"]) - column_number(match["first"]) + 1
+
+
+def range_height(range_name: str) -> Optional[int]:
+    """Returns how many rows an A1 range spans, if it names both row numbers."""
+    match = _A1_ROWS_RE.search(range_name)
+    if not match:
+        return None
+    return int(match["last"]) - int(match["first"]) + 1
+
+
+def merge_column_blocks(
+    blocks: List[List[List[Any]]], widths: List[Optional[int]]
+) -> List[List[Any]]:
+    """Joins side-by-side column ranges into rows, padding trimmed cells."""
+    if len(blocks) == 1:
+        return blocks[0]
+
+    height = max((len(block) for block in blocks), default=0)
+    padded = []
+    for block, width in zip(blocks, widths):
+        width = width or max((len(row) for row in block), default=0)
+        rows = [row + [None] * (width - len(row)) for row in block]
+        rows.extend([None] * width for _ in range(height - len(rows)))
+        padded.append(rows)
+
+    return [list(itertools.chain.from_iterable(parts)) for parts in zip(*padded)]
+
+
+def fetch_raw_data(
+    limit: Optional[int] = None, force_refresh: bool = False
+) -> pd.DataFrame:
+    """Fetches raw VOC rows from Google Sheets into a DataFrame.
+
+    The raw sheet values are cached on disk and reused while the spreadsheet's
+    Drive modifiedTime is unchanged; ``force_refresh`` always reads the API.
+    """
     spreadsheet_id = os.environ.get("GOOGLE_SHEETS_SPREADSHEET_ID")
-    range_name = os.environ.get("GOOGLE_SHEETS_RANGE", "raw data!K:S")
+    ranges = get_sheet_ranges()
 
     if not spreadsheet_id:
         raise ValueError(
@@ -86,23 +339,29 @@ def fetch_raw_data(limit: Optional[int] = None) -> pd.DataFrame:
             "Define it in .env or your shell environment."
         )
 
-    creds = get_credentials()
-    service = build("sheets", "v4", credentials=creds)
+    # Looked up before reading so edits made mid-fetch invalidate the cache.
+    modified_time = get_spreadsheet_modified_time(spreadsheet_id)
+    cache_key = None
+    if modified_time is not None:
+        cache_key = {
+            "spreadsheet_id": spreadsheet_id,
+            "ranges": ranges,
+            "modified_time": modified_time,
+        }
 
-    response = (
-        service.spreadsheets()
-        .values()
-        .get(spreadsheetId=spreadsheet_id, range=range_name)
-        .execute()
-    )
+    values = None
+    if cache_key is not None and not force_refresh:
+        values = load_cached_rows(cache_key)
+    if values is None:
+        values = read_sheet_rows(spreadsheet_id, ranges)
+        if cache_key is not None and values:
+            save_cached_rows(values, cache_key)
 
-    values = response.get("values", [])
     if not values:
         return pd.DataFrame()
 
     header, *rows = values
-    df = pd.DataFrame(rows, columns=header)
-    df = standardise_columns(df)
+    df = standardise_columns(rows_to_frame(header, rows))
 
     if limit is not None:
         df = df.head(limit)
@@ -110,15 +369,87 @@ def fetch_raw_data(limit: Optional[int] = None) -> pd.DataFrame:
     return df
 
 
-def print_sample_rows(limit: int) -> None:
+def read_sheet_rows(spreadsheet_id: str, ranges: List[str]) -> List[List[Any]]:
+    """Reads ``ranges`` from the spreadsheet as raw rows (header first)."""
+    service = get_sheets_service()
+
+    row_counts: Dict[str, int] = {}
+    if any(_COLUMN_RANGE_RE.match(range_name) for range_name in ranges):
+        row_counts = get_sheet_row_counts(service, spreadsheet_id)
+    chunked = [split_sheet_range(range_name, row_counts) for range_name in ranges]
+    if len({len(chunks) for chunks in chunked}) > 1:
+        # Ranges on differently sized sheets cannot be chunked in lockstep.
+        chunked = [[range_name] for range_name in ranges]
+    widths = [range_width(range_name) for range_name in ranges]
+
+    # Unformatted values return date cells as serial numbers, which skips the
+    # string normalisation in parse_created_at_series. All ranges for a row
+    # chunk come back in one batchGet; large sheets are read chunk by chunk so
+    # only one response payload is held at a time.
+    values: List[List[Any]] = []
+    chunk_count = len(chunked[0]) if chunked else 0
+    for index, chunk_ranges in enumerate(zip(*chunked)):
+        response = (
+            service.spreadsheets()
+            .values()
+            .batchGet(
+                spreadsheetId=spreadsheet_id,
+                ranges=list(chunk_ranges),
+                majorDimension="ROWS",
+                valueRenderOption="UNFORMATTED_VALUE",
+                dateTimeRenderOption="SERIAL_NUMBER",
+            )
+            .execute(num_retries=SHEETS_NUM_RETRIES)
+        )
+        blocks = [
+            value_range.get("values", [])
+            for value_range in response.get("valueRanges", [])
+        ]
+        rows = merge_column_blocks(blocks, widths) if blocks else []
+        # Sheets drops trailing blank rows from each response; keep them for
+        # every chunk but the last so blank rows count the same wherever the
+        # chunk boundaries fall.
+        height = range_height(chunk_ranges[0])
+        if index < chunk_count - 1 and height is not None:
+            rows.extend([] for _ in range(height - len(rows)))
+        values.extend(rows)
+
+    # Like an unchunked read, end at the last non-blank row.
+    while values and all(cell is None or cell == "" for cell in values[-1]):
+        values.pop()
+    return values
+
+
+def rows_to_frame(header: List[Any], rows: List[List[Any]]) -> pd.DataFrame:
+    """Builds a DataFrame column by column from (ragged) Sheets rows.
+
+    Transposing with zip_longest hands pandas one list per column, instead of
+    a row-major list of lists it would have to pad and split itself.
+    """
+    if not rows:
+        return pd.DataFrame(columns=header)
+
+    width = len(header)
+    columns = list(
+        itertools.zip_longest(*(row[:width] for row in rows), fillvalue=None)
+    )
+    columns.extend([(None,) * len(rows)] * (width - len(columns)))
+    df = pd.DataFrame(
+        {position: list(column) for position, column in enumerate(columns)}
+    )
+    df.columns = header
+    return df
+
+
+def print_sample_rows(limit: int, force_refresh: bool = False) -> None:
     """Fetches a small sample and prints it for manual inspection."""
-    df = fetch_raw_data(limit=limit)
+    df = fetch_raw_data(limit=limit, force_refresh=force_refresh)
     if df.empty:
         print("No data returned from Google Sheets (check range or sheet).")
         return
 
     # Keep the output compact for console viewing.
-    print(df.to_markdown(index=False))
+    print(df.to_string(index=False, max_colwidth=80))
 
 
 def standardise_columns(df: pd.DataFrame) -> pd.DataFrame:
@@ -138,10 +469,18 @@ def standardise_columns(df: pd.DataFrame) -> pd.DataFrame:
 
     if "created_at" in df.columns:
         df["created_at_raw"] = df["created_at"]
-        df["created_at"] = df["created_at"].apply(parse_created_at)
+        df["created_at"] = parse_created_at_series(df["created_at"])
 
     df = assign_content_text(df)
 
+    # Category labels repeat heavily; store them once and count on int codes.
+    for col in ("category", "subcategory"):
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in ("content", "content_text"):
+        if col in df.columns:
+            df[col] = df[col].astype(TEXT_DTYPE)
+
     return df
 
 
@@ -151,6 +490,15 @@ def is_json_object(value: Any) -> bool:
     text = value.strip()
     if not (text.startswith("{") and text.endswith("}")):
         return False
+    # Any non-empty object needs a key/value colon; skip the parser otherwise.
+    if ":" not in text:
+        return text[1:-1].strip() == ""
+    return _parses_as_json(text)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parses_as_json(text: str) -> bool:
+    """json.loads check, memoised because VOC rows repeat boilerplate."""
     try:
         json.loads(text)
         return True
@@ -175,44 +523,62 @@ def assign_content_text(df: pd.DataFrame) -> pd.DataFrame:
 
     candidate_columns = list(dict.fromkeys(candidate_columns))
 
-    content_series: List[str] = []
-    for idx, row in df.iterrows():
-        chosen: Optional[str] = None
-
-        for col in candidate_columns:
-            value = row.get(col)
-            if value is None or pd.isna(value):
-                continue
-            text = str(value).strip()
-            if not text:
-                continue
-            if is_json_object(text):
-                continue
-            chosen = text
-            break
+    chosen = pd.Series(pd.NA, index=df.index, dtype=TEXT_DTYPE)
+    for col in candidate_columns:
+        text = df[col].astype(TEXT_DTYPE).str.strip()
+        usable = text.ne("") & ~json_object_mask(text)
+        chosen = chosen.fillna(text.where(usable.fillna(False)))
 
-        if chosen is None:
-            raw = row.get("content")
-            if isinstance(raw, str) and is_json_object(raw):
-                try:
-                    parsed = json.loads(raw)
-                    desc = parsed.get("desc") or parsed.get("description")
-                    if desc:
-                        chosen = str(desc).strip()
-                except Exception:
-                    chosen = None
-
-        if chosen is None:
-            fallback = row.get("content")
-            if fallback is not None and not pd.isna(fallback):
-                chosen = str(fallback).strip()
-
-        content_series.append(chosen or "")
-
-    df["content_text"] = pd.Series(content_series, index=df.index)
+    if "content" in df.columns:
+        content = df["content"].astype(TEXT_DTYPE).str.strip()
+
+        # JSON payloads in content: use their desc/description field.
+        is_json = chosen.isna() & json_object_mask(content)
+        if is_json.any():
+            desc = content[is_json].map(extract_json_desc, na_action="ignore")
+            chosen = chosen.fillna(desc.astype(TEXT_DTYPE))
+
+        chosen = chosen.fillna(content)
+
+    df["content_text"] = chosen.fillna("").astype(str)
     return df
 
 
+def json_object_mask(text: pd.Series) -> pd.Series:
+    """Vectorised is_json_object; only brace-delimited values get parsed."""
+    mask = text.str.startswith("{").fillna(False) & text.str.endswith("}").fillna(False)
+    if mask.any():
+        mask[mask] = text[mask].map(is_json_object).astype(bool)
+    return mask.astype(bool)
+
+
+def extract_json_desc(text: str) -> Optional[str]:
+    """Returns the desc/description field of a JSON object string, if any."""
+    try:
+        parsed = json.loads(text)
+    except Exception:
+        return None
+    desc = parsed.get("desc") or parsed.get("description")
+    return str(desc).strip() if desc else None
+
+
+def created_at_ns(df: pd.DataFrame) -> np.ndarray:
+    """Returns created_at as int64 UTC nanoseconds (NAT_NS where missing).
+
+    For frames from standardise_columns this is a view of the column's
+    buffer, so callers can each ask for it instead of passing a
+    converted copy around.
+    """
+    created = df["created_at"]
+    # standardise_columns already stores tz-aware timestamps; their int64
+    # values are UTC, so only raw frames need to go through to_datetime.
+    if not isinstance(created.dtype, pd.DatetimeTZDtype):
+        created = pd.to_datetime(created, errors="coerce", utc=True)
+    if created.dt.unit != "ns":
+        created = created.dt.as_unit("ns")
+    return created.array.asi8
+
+
 def compute_recent_windows_kst(
     df: pd.DataFrame, reference: Optional[pd.Timestamp] = None
 ) -> Dict[str, pd.DataFrame]:
@@ -221,36 +587,30 @@ def compute_recent_windows_kst(
     if "created_at" not in df.columns:
         return {"full": df, "recent_30d": empty, "recent_90d": empty, "prev_30d": empty}
 
-    created = pd.to_datetime(df["created_at"], errors="coerce", utc=True)
-    if created.isna().all():
+    created_ns = created_at_ns(df)
+    mask_valid = created_ns != NAT_NS
+    if not mask_valid.any():
         return {"full": df, "recent_30d": empty, "recent_90d": empty, "prev_30d": empty}
 
-    created_kst = created.dt.tz_convert("Asia/Seoul")
-    created_kst_day = created_kst.dt.normalize()
-
-    if reference is not None:
-        ref_kst = reference.tz_convert("Asia/Seoul")
-    else:
-        ref_kst = pd.Timestamp.now(tz="Asia/Seoul")
-
-    today0 = ref_kst.normalize()
-    tomorrow0 = today0 + pd.Timedelta(days=1)
+    # Work on KST wall-clock day indices (days since epoch) as plain int64.
+    days = (created_ns + KST_OFFSET_NS) // NS_PER_DAY
 
-    start30 = today0 - pd.Timedelta(days=29)
-    prev_start30 = start30 - pd.Timedelta(days=30)
-    prev_end30 = start30
-    start90 = today0 - pd.Timedelta(days=89)
+    if reference is None:
+        reference = pd.Timestamp.now(tz=_SEOUL_TZ)
 
-    mask_valid = created_kst_day.notna()
-    mask_future = created_kst_day < tomorrow0
+    today = (reference.value + KST_OFFSET_NS) // NS_PER_DAY
 
-    mask_recent_30 = mask_valid & mask_future & (created_kst_day >= start30)
-    mask_prev_30 = mask_valid & (created_kst_day >= prev_start30) & (created_kst_day < prev_end30)
-    mask_recent_90 = mask_valid & mask_future & (created_kst_day >= start90)
+    # Label each row once by its age in KST days: 0 for the recent 30 days
+    # (age 0-29), 1 for the 30 days before (30-59), 2 for 60-89, else -1.
+    # The recent 90 days are every labelled row.
+    age = today - days
+    in_90 = mask_valid & (age >= 0) & (age < 90)
+    window = np.where(in_90, age // 30, -1).astype(np.int8)
 
-    recent_30 = df[mask_recent_30]
-    prev_30 = df[mask_prev_30]
-    recent_90 = df[mask_recent_90]
+    # Positional takes skip the label/boolean-indexer alignment of df[mask].
+    recent_30 = df.iloc[np.flatnonzero(window == 0)]
+    prev_30 = df.iloc[np.flatnonzero(window == 1)]
+    recent_90 = df.iloc[np.flatnonzero(in_90)]
 
     return {
         "full": df,
@@ -265,8 +625,15 @@ def top_categories(df: pd.DataFrame, limit: int = 5) -> List[Tuple[str, int]]:
     if "category" not in df or df.empty:
         return []
 
-    counts = df["category"].fillna("미분류").value_counts().head(limit)
-    return list(counts.items())
+    # Counter is cheaper than building a sorted value_counts Series for the
+    # handful of categories in a window; ties keep first-appearance order.
+    # Missing labels are counted as-is and folded into 미분류 afterwards,
+    # instead of filling a copy of the column first.
+    counts = Counter(df["category"].tolist())
+    missing = [key for key in counts if pd.isna(key)]
+    if missing:
+        counts["미분류"] += sum(counts.pop(key) for key in missing)
+    return counts.most_common(limit)
 
 
 def month_over_month_change(df: pd.DataFrame) -> Dict[str, float]:
@@ -274,47 +641,54 @@ def month_over_month_change(df: pd.DataFrame) -> Dict[str, float]:
     if "created_at" not in df or "category" not in df:
         return {}
 
-    df = df.dropna(subset=["created_at"]).copy()
-    if df.empty:
+    created_ns = created_at_ns(df)
+    mask_valid = created_ns != NAT_NS
+    if not mask_valid.any():
         return {}
 
-    created_utc = df["created_at"].dt.tz_convert("UTC")
-    created_naive = created_utc.dt.tz_localize(None)
-
-    latest_month_start = created_naive.max().to_period("M").to_timestamp()
-    prev_month_start = latest_month_start - pd.DateOffset(months=1)
-    latest_month_end = latest_month_start + pd.offsets.MonthEnd(0)
-    prev_month_end = prev_month_start + pd.offsets.MonthEnd(0)
+    # UTC calendar months since epoch, bucketed on the raw nanosecond values.
+    month = created_ns.view("M8[ns]").astype("M8[M]").astype("i8")
+    latest_month = month[mask_valid].max()
+    prev_month = latest_month - 1
+    in_scope = mask_valid & (month >= prev_month)
 
-    this_month = df[
-        created_naive.between(latest_month_start, latest_month_end)
-    ]
-    prev_month = df[
-        created_naive.between(prev_month_start, prev_month_end)
-    ]
-
-    if this_month.empty and prev_month.empty:
+    counts = (
+        pd.DataFrame(
+            {
+                "month": month[in_scope],
+                "category": df["category"].array[in_scope],
+            }
+        )
+        # observed=True: group only the categories present, not every label.
+        .groupby(["category", "month"], observed=True)
+        .size()
+        .unstack("month", fill_value=0)
+        .reindex(columns=[prev_month, latest_month], fill_value=0)
+    )
+    if counts.empty:
         return {}
 
-    this_counts = this_month["category"].value_counts()
-    prev_counts = prev_month["category"].value_counts()
+    current = counts[latest_month].to_numpy(dtype=float)
+    previous = counts[prev_month].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        changes = np.where(
+            previous == 0,
+            np.where(current > 0, np.inf, 0.0),
+            (current - previous) / previous * 100,
+        )
 
-    categories = set(this_counts.index).union(prev_counts.index)
-    changes: Dict[str, float] = {}
-    for category in categories:
-        current = this_counts.get(category, 0)
-        previous = prev_counts.get(category, 0)
-        if previous == 0:
-            changes[category] = float("inf") if current > 0 else 0.0
-        else:
-            changes[category] = (current - previous) / previous * 100
+    return dict(zip(counts.index, changes.tolist()))
 
-    return changes
 
+def summarise_stats(
+    df: pd.DataFrame, windows: Optional[Dict[str, pd.DataFrame]] = None
+) -> Dict[str, Any]:
+    """Builds a dictionary with core stats for recent windows.
 
-def summarise_stats(df: pd.DataFrame) -> Dict[str, Any]:
-    """Builds a dictionary with core stats for recent windows."""
-    windows = compute_recent_windows_kst(df)
+    Pass ``windows`` from compute_recent_windows_kst to avoid recomputing them.
+    """
+    if windows is None:
+        windows = compute_recent_windows_kst(df)
     date_info = extract_date_info(df)
 
     summary = {
@@ -333,45 +707,68 @@ def summarise_stats(df: pd.DataFrame) -> Dict[str, Any]:
     return summary
 
 
-def parse_created_at(value) -> Optional[pd.Timestamp]:
-    """Parses various created_at formats into UTC timestamps."""
-    if value is None or value == "":
-        return pd.NaT
+def parse_created_at_series(values: pd.Series) -> pd.Series:
+    """Parses a created_at column into UTC timestamps (NaT where unparseable).
 
-    if isinstance(value, (int, float)):
-        # Treat numeric values as Excel serials (days since 1899-12-30).
-        try:
-            return pd.to_datetime(value, unit="d", origin="1899-12-30", utc=True)
-        except Exception:
-            return pd.NaT
+    Numbers are Excel serials (days since 1899-12-30) and text uses
+    CREATED_AT_FORMATS; both hold Asia/Seoul wall-clock time.
+    """
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind in ("string", "empty"):
+        return _parse_created_at_text(values)
+    if kind in ("integer", "floating", "mixed-integer-float"):
+        return _parse_created_at_serial(pd.to_numeric(values, errors="coerce"))
 
-    text = str(value).strip()
-    if not text:
-        return pd.NaT
+    # Mixed column: serial date cells alongside free-text cells.
+    is_text = values.map(type).eq(str)
+    parsed = _parse_created_at_serial(
+        pd.to_numeric(values.where(~is_text), errors="coerce")
+    )
+    if is_text.any():
+        parsed = parsed.fillna(_parse_created_at_text(values[is_text]))
+    return parsed
+
+
+def _localize_kst(local: pd.Series) -> pd.Series:
+    """Interprets naive Asia/Seoul wall-clock datetimes and converts to UTC."""
+    return local.dt.tz_localize(
+        _SEOUL_TZ, ambiguous="NaT", nonexistent="shift_forward"
+    ).dt.tz_convert("UTC")
+
+
+def _parse_created_at_serial(numbers: pd.Series) -> pd.Series:
+    """Converts Excel serial day numbers (days since 1899-12-30) in one pass."""
+    return _localize_kst(pd.to_datetime(numbers, unit="D", origin="1899-12-30"))
 
+
+def _parse_created_at_text(values: pd.Series) -> pd.Series:
+    """Parses textual created_at values using CREATED_AT_FORMATS."""
     # Normalize Korean AM/PM markers and dot-separated date parts.
-    text = text.replace("오전", "AM").replace("오후", "PM")
-    text = re.sub(r"\.\s*", "-", text)
-    text = re.sub(r"\s+", " ", text)
-
-    seoul_tz = ZoneInfo("Asia/Seoul")
-    formats = [
-        "%Y-%m-%d %p %I:%M:%S",
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d",
-    ]
-    for fmt in formats:
-        try:
-            dt = datetime.strptime(text, fmt)
-            if fmt.endswith("%p %I:%M:%S") or fmt.endswith("%H:%M:%S"):
-                dt = dt.replace(tzinfo=seoul_tz)
-            else:
-                dt = datetime.combine(dt.date(), datetime.min.time(), tzinfo=seoul_tz)
-            return pd.Timestamp(dt.astimezone(timezone.utc))
-        except ValueError:
-            continue
+    text = (
+        values.astype("string")
+        .str.strip()
+        .str.replace("오전", "AM", regex=False)
+        .str.replace("오후", "PM", regex=False)
+        .str.replace(_DOT_RE, "-", regex=True)
+        .str.replace(_WS_RE, " ", regex=True)
+    )
+
+    local = pd.Series(pd.NaT, index=values.index, dtype="datetime64[ns]")
+    for fmt in CREATED_AT_FORMATS:
+        pending = local.isna() & text.notna()
+        if not pending.any():
+            break
+        local = local.fillna(pd.to_datetime(text[pending], format=fmt, errors="coerce"))
+
+    parsed = _localize_kst(local)
 
-    return pd.to_datetime(text, errors="coerce", utc=True)
+    # Anything the known formats missed goes through per-element inference.
+    remaining = parsed.isna() & text.fillna("").ne("")
+    if remaining.any():
+        parsed = parsed.fillna(
+            pd.to_datetime(text[remaining], format="mixed", errors="coerce", utc=True)
+        )
+    return parsed
 
 
 def extract_date_info(df: pd.DataFrame) -> Dict[str, object]:
@@ -381,43 +778,44 @@ def extract_date_info(df: pd.DataFrame) -> Dict[str, object]:
 
     series = df["created_at"]
     valid = series.dropna()
+    created_min, created_max = valid.min(), valid.max()
     return {
-        "min": valid.min(),
-        "max": valid.max(),
+        "min": created_min if pd.notna(created_min) else None,
+        "max": created_max if pd.notna(created_max) else None,
         "invalid_count": len(series) - len(valid),
     }
 
 
-def map_category_to_phase(category: Optional[str]) -> str:
-    """Maps a category string into a learning phase bucket."""
-    if not category:
-        return "기타"
-
-    category = category.strip().lower()
-    phase_rules = [
-        ("장비", "준비"),
-        ("기기", "준비"),
-        ("환경", "준비"),
-        ("수업", "진행"),
-        ("커리큘럼", "진행"),
-        ("멘토", "진행"),
-        ("지원", "지원"),
-        ("장려금", "행정"),
-        ("행정", "행정"),
-        ("출석", "행정"),
+def map_categories_to_phase(categories: pd.Series) -> pd.Series:
+    """Maps each category into a learning phase bucket (first matching rule)."""
+    text = categories.astype(TEXT_DTYPE).str.strip().str.lower().fillna("")
+    conditions = [
+        text.str.contains(pattern.pattern, regex=True).to_numpy(dtype=bool)
+        for pattern, _ in _CATEGORY_PHASE_PATTERNS
     ]
-    for keyword, phase in phase_rules:
-        if keyword in category:
-            return phase
-    return "기타"
+    choices = [phase for _, phase in _CATEGORY_PHASE_PATTERNS]
+    return pd.Series(
+        np.select(conditions, choices, default="기타"), index=categories.index
+    )
 
 
 def aggregate_phase_counts(df: pd.DataFrame) -> Dict[str, int]:
     """Counts VOCs per learning phase."""
-    if df.empty:
+    if df.empty or "category" not in df:
         return {}
-    phases = df.get("category", pd.Series(dtype=str)).apply(map_category_to_phase)
-    return phases.value_counts().to_dict()
+    # Classify each distinct category once rather than every row.
+    counts = df["category"].value_counts(dropna=False)
+    counts = counts[counts > 0]
+    phases = map_categories_to_phase(pd.Series(counts.index, index=counts.index))
+    totals = counts.groupby(phases.to_numpy(), sort=False).sum()
+    return totals.sort_values(ascending=False).to_dict()
+
+
+def text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Returns ``column`` as text with NA filled, or blanks if it is missing."""
+    if column in df.columns:
+        return df[column].astype(TEXT_DTYPE).fillna("")
+    return pd.Series("", index=df.index, dtype=TEXT_DTYPE)
 
 
 def compose_issue_keys(df: pd.DataFrame) -> pd.Series:
@@ -425,32 +823,42 @@ def compose_issue_keys(df: pd.DataFrame) -> pd.Series:
     if df.empty:
         return pd.Series(dtype=str)
 
-    categories = df.get("category", pd.Series(index=df.index, dtype=str)).fillna("")
-    subcategories = df.get(
-        "subcategory", pd.Series(index=df.index, dtype=str)
-    ).fillna("")
+    categories = text_column(df, "category").str.strip()
+    subcategories = text_column(df, "subcategory").str.strip()
 
-    categories = categories.astype(str).str.strip()
-    subcategories = subcategories.astype(str).str.strip()
-
-    issue_keys = categories.copy()
-    mask_sub = subcategories != ""
-    issue_keys.loc[mask_sub] = (
-        categories.loc[mask_sub] + " > " + subcategories.loc[mask_sub]
-    )
+    category_values = categories.to_numpy(dtype=object)
+    subcategory_values = subcategories.to_numpy(dtype=object)
+    joined = (categories + " > " + subcategories).to_numpy(dtype=object)
 
-    return issue_keys.where(issue_keys != "", "미분류")
+    issue_keys = np.where(subcategory_values != "", joined, category_values)
+    issue_keys = np.where(issue_keys == "", "미분류", issue_keys)
+    return pd.Series(issue_keys, index=df.index, dtype=object)
 
 
-def compute_issue_counts(df: pd.DataFrame) -> Dict[str, int]:
+def compute_issue_counts(
+    df: pd.DataFrame, issue_keys: Optional[pd.Series] = None
+) -> Dict[str, int]:
     """Counts occurrences per issue key."""
-    issue_keys = compose_issue_keys(df)
+    if issue_keys is None:
+        issue_keys = compose_issue_keys(df)
     if issue_keys.empty:
         return {}
     counts = issue_keys.value_counts()
     return counts.to_dict()
 
 
+def quote_texts(df: pd.DataFrame, max_length: int = 120) -> pd.Series:
+    """Returns one-line quote text per row (content_text, else content)."""
+    text = text_column(df, "content_text")
+    if "content" in df.columns:
+        text = text.mask(text.eq(""), text_column(df, "content"))
+
+    text = text.str.strip().str.replace("\n", " ", regex=False)
+    return text.mask(
+        text.str.len() > max_length, text.str.slice(0, max_length - 3) + "..."
+    )
+
+
 def change_percentage(current: int, previous: int) -> float:
     """Mimics Apps Script changePct calculation."""
     if previous == 0 and current > 0:
@@ -465,35 +873,29 @@ def summarize_top_issues(
     previous_df: pd.DataFrame,
     limit: int = 5,
     quotes_per_issue: int = 2,
+    current_issue_keys: Optional[pd.Series] = None,
+    previous_issue_keys: Optional[pd.Series] = None,
 ) -> List[Dict[str, Any]]:
-    """Returns top issues with counts and change percentage, mirroring Apps Script."""
-    current_counts = compute_issue_counts(current_df)
-    previous_counts = compute_issue_counts(previous_df)
+    """Returns top issues with counts and change percentage, mirroring Apps Script.
+
+    Precomputed ``compose_issue_keys`` results may be passed in to avoid
+    rebuilding them when the caller already has them.
+    """
+    if current_issue_keys is None:
+        current_issue_keys = compose_issue_keys(current_df)
+    current_counts = compute_issue_counts(current_df, current_issue_keys)
+    previous_counts = compute_issue_counts(previous_df, previous_issue_keys)
 
     issue_quotes: Dict[str, List[str]] = {}
     if not current_df.empty:
-        issue_keys = compose_issue_keys(current_df)
-        content_series = current_df.get(
-            "content_text", pd.Series(index=current_df.index, dtype=str)
+        quotes = pd.DataFrame(
+            {"issue_key": current_issue_keys, "text": quote_texts(current_df)}
         )
-        for idx, issue_key in issue_keys.items():
-            if not isinstance(issue_key, str):
-                continue
-            text_value = ""
-            if content_series is not None and idx in content_series.index:
-                text_value = str(content_series.loc[idx])
-            if not text_value and "content" in current_df.columns:
-                text_value = str(current_df.loc[idx].get("content", "") or "")
-            text_value = text_value.strip().replace("\n", " ")
-            if not text_value:
-                continue
-            if issue_key not in issue_quotes:
-                issue_quotes[issue_key] = []
-            if len(issue_quotes[issue_key]) >= quotes_per_issue:
-                continue
-            if len(text_value) > 120:
-                text_value = text_value[:117] + "..."
-            issue_quotes[issue_key].append(f'예: "{text_value}"')
+        quotes = quotes[quotes["text"].ne("")]
+        # First quotes_per_issue non-empty texts per issue, in row order.
+        first_quotes = quotes.groupby("issue_key", sort=False).head(quotes_per_issue)
+        for issue_key, text in zip(first_quotes["issue_key"], first_quotes["text"]):
+            issue_quotes.setdefault(issue_key, []).append(f'예: "{text}"')
 
     rows = []
     for issue_key, count in current_counts.items():
@@ -521,25 +923,23 @@ def build_issue_summary(issue_key: str, change_pct: float) -> str:
     return f"{issue_key} 전월 대비 {sign}{rounded}%"
 
 
-def determine_phase_from_row(row: pd.Series) -> str:
-    """Assigns a phase using category, subcategory, and content heuristics."""
-    text = " ".join(
-        str(row.get(col, "") or "")
-        for col in ("category", "subcategory", "content_text", "content")
-    ).lower()
+def determine_phases(df: pd.DataFrame) -> pd.Series:
+    """Assigns a phase per row using category, subcategory, and content heuristics.
 
-    patterns = [
-        (r"(장비|노트북|맥북|사양|대여|반납|주변기기|모니터|마우스|키보드)", "학습 준비"),
-        (r"(플랫폼|실습|콘솔|빌드|로그인|접속|출결|qr|오류|강의실)", "학습 진행"),
-        (r"(장려금|지원금|지급|자격|증빙|정산)", "학습 지원"),
-        (r"(수강 변경|휴가|공가|행정|신청|증명서|환불|이관|출석)", "행정 처리"),
-    ]
-
-    for pattern, phase in patterns:
-        if re.search(pattern, text):
-            return phase
+    The columns are joined with spaces and lower-cased; the first matching
+    PHASE_PATTERNS entry wins, else DEFAULT_PHASE.
+    """
+    parts = [text_column(df, col) for col in PHASE_TEXT_COLUMNS]
+    text = parts[0].str.cat(parts[1:], sep=" ").str.lower()
 
-    return "학습 진행"
+    conditions = [
+        text.str.contains(pattern.pattern, regex=True).to_numpy(dtype=bool)
+        for pattern, _ in PHASE_PATTERNS
+    ]
+    phases = np.select(
+        conditions, [phase for _, phase in PHASE_PATTERNS], default=DEFAULT_PHASE
+    )
+    return pd.Series(phases, index=df.index, dtype=object)
 
 
 def aggregate_phase_breakdown(
@@ -547,85 +947,81 @@ def aggregate_phase_breakdown(
     previous_df: pd.DataFrame,
     quotes_per_issue: int = 2,
     top_per_phase: int = 6,
+    current_issue_keys: Optional[pd.Series] = None,
+    previous_issue_keys: Optional[pd.Series] = None,
 ) -> Dict[str, Dict[str, Any]]:
-    """Builds phase-specific breakdown similar to Apps Script."""
+    """Builds phase-specific breakdown similar to Apps Script.
+
+    Like ``summarize_top_issues``, accepts precomputed issue keys.
+    """
     if current_df.empty:
         return {}
 
-    current_phase = current_df.apply(determine_phase_from_row, axis=1)
-    prev_phase = (
-        previous_df.apply(determine_phase_from_row, axis=1)
-        if not previous_df.empty
-        else pd.Series(index=previous_df.index, dtype=str)
-    )
-
-    current_issues = compose_issue_keys(current_df)
-    prev_issues = compose_issue_keys(previous_df) if not previous_df.empty else None
-    current_texts = current_df.get(
-        "content_text", pd.Series(index=current_df.index, dtype=str)
+    if current_issue_keys is None:
+        current_issue_keys = compose_issue_keys(current_df)
+    current = pd.DataFrame(
+        {
+            "phase": determine_phases(current_df),
+            "issue_key": current_issue_keys,
+            "text": quote_texts(current_df),
+        }
     )
-
-    phase_data: Dict[str, Dict[str, Any]] = {}
-
-    for idx, phase in current_phase.items():
-        issue_key = current_issues.get(idx, "미분류")
-        phase_bucket = phase_data.setdefault(
-            phase,
-            {"total": 0, "issues": {}, "quotes": {}},
+    keys = ["phase", "issue_key"]
+    # sort=False keeps first-appearance order, which breaks count ties below.
+    counts = current.groupby(keys, sort=False).size()
+
+    prev_counts: Dict[Tuple[str, str], int] = {}
+    if not previous_df.empty:
+        if previous_issue_keys is None:
+            previous_issue_keys = compose_issue_keys(previous_df)
+        previous = pd.DataFrame(
+            {
+                "phase": determine_phases(previous_df),
+                "issue_key": previous_issue_keys,
+            }
         )
-        phase_bucket["total"] += 1
-        phase_bucket["issues"][issue_key] = phase_bucket["issues"].get(issue_key, 0) + 1
-
-        if issue_key not in phase_bucket["quotes"]:
-            phase_bucket["quotes"][issue_key] = []
-        if len(phase_bucket["quotes"][issue_key]) < quotes_per_issue:
-            text_val = ""
-            if current_texts is not None and idx in current_texts.index:
-                text_val = str(current_texts.loc[idx] or "")
-            if not text_val:
-                text_val = str(current_df.loc[idx].get("content", "") or "")
-            text_val = text_val.strip().replace("\n", " ")
-            if text_val:
-                if len(text_val) > 120:
-                    text_val = text_val[:117] + "..."
-                phase_bucket["quotes"][issue_key].append(f'예: "{text_val}"')
-
-    prev_counts: Dict[str, Dict[str, int]] = {}
-    if prev_issues is not None:
-        for idx, phase in prev_phase.items():
-            issue_key = prev_issues.get(idx, "미분류")
-            prev_phase_bucket = prev_counts.setdefault(phase, {})
-            prev_phase_bucket[issue_key] = prev_phase_bucket.get(issue_key, 0) + 1
+        prev_counts = previous.groupby(keys, sort=False).size().to_dict()
+
+    quotes: Dict[Tuple[str, str], List[str]] = {}
+    with_text = current[current["text"].ne("")]
+    first_quotes = with_text.groupby(keys, sort=False).head(quotes_per_issue)
+    for phase, issue_key, text in zip(
+        first_quotes["phase"], first_quotes["issue_key"], first_quotes["text"]
+    ):
+        quotes.setdefault((phase, issue_key), []).append(f'예: "{text}"')
 
     result: Dict[str, Dict[str, Any]] = {}
-    for phase, info in phase_data.items():
+    for phase, phase_counts in counts.groupby(level="phase", sort=False):
+        top_counts = phase_counts.sort_values(ascending=False, kind="stable")
         issues_list = []
-        for issue_key, count in info["issues"].items():
-            previous = prev_counts.get(phase, {}).get(issue_key, 0)
-            change = round(change_percentage(count, previous), 1)
+        for (_, issue_key), count in top_counts.head(top_per_phase).items():
+            previous = int(prev_counts.get((phase, issue_key), 0))
+            change = round(change_percentage(int(count), previous), 1)
             issues_list.append(
                 {
                     "issue_key": issue_key,
-                    "count": count,
+                    "count": int(count),
                     "previous_count": previous,
                     "change_pct": change,
                     "summary": build_issue_summary(issue_key, change),
-                    "quotes": info["quotes"].get(issue_key, []),
+                    "quotes": quotes.get((phase, issue_key), []),
                 }
             )
 
-        issues_list.sort(key=lambda item: item["count"], reverse=True)
         result[phase] = {
-            "total": info["total"],
-            "issues": issues_list[:top_per_phase],
+            "total": int(phase_counts.sum()),
+            "issues": issues_list,
         }
 
     return result
 
 
-def build_trend_cards(df: pd.DataFrame) -> List[Dict[str, Any]]:
+def build_trend_cards(
+    df: pd.DataFrame, changes: Optional[Dict[str, float]] = None
+) -> List[Dict[str, Any]]:
     """Builds trend info combining month-over-month change with color cues."""
-    changes = month_over_month_change(df)
+    if changes is None:
+        changes = month_over_month_change(df)
     trends = []
     for category, delta in changes.items():
         if delta == float("inf"):
@@ -662,24 +1058,34 @@ def extract_quotes(df: pd.DataFrame, limit: int = 2) -> List[str]:
     if content_series is None or content_series.dropna().empty:
         return []
 
-    quotes = []
-    for value in content_series.dropna().head(limit):
-        text = str(value).strip().replace("\n", " ")
-        if len(text) > 180:
-            text = text[:177] + "..."
-        quotes.append(text)
-    return quotes
+    quotes = (
+        content_series.dropna()
+        .head(limit)
+        .astype(TEXT_DTYPE)
+        .str.strip()
+        .str.replace("\n", " ", regex=False)
+    )
+    quotes = quotes.mask(quotes.str.len() > 180, quotes.str.slice(0, 177) + "...")
+    return quotes.tolist()
 
 
 def build_report(df: pd.DataFrame) -> Dict[str, Any]:
     """Creates a structured JSON-ready report payload."""
-    now_kst = pd.Timestamp.now(tz="Asia/Seoul")
+    now_kst = pd.Timestamp.now(tz=_SEOUL_TZ)
     windows = compute_recent_windows_kst(df, reference=now_kst)
-    stats = summarise_stats(df)
+    stats = summarise_stats(df, windows=windows)
 
     recent_30 = windows["recent_30d"]
     prev_30 = windows["prev_30d"]
-    top_issues = summarize_top_issues(recent_30, prev_30, limit=5)
+    issue_keys = compose_issue_keys(recent_30)
+    prev_issue_keys = compose_issue_keys(prev_30)
+    top_issues = summarize_top_issues(
+        recent_30,
+        prev_30,
+        limit=5,
+        current_issue_keys=issue_keys,
+        previous_issue_keys=prev_issue_keys,
+    )
     top_issue_rows = []
     for rank, item in enumerate(top_issues, start=1):
         top_issue_rows.append(
@@ -712,8 +1118,13 @@ def build_report(df: pd.DataFrame) -> Dict[str, Any]:
         "issues": {
             "top_recent_30d": top_issue_rows,
             "phase_counts": aggregate_phase_counts(recent_30),
-            "phase_breakdown": aggregate_phase_breakdown(recent_30, prev_30),
-            "trend_cards": build_trend_cards(df),
+            "phase_breakdown": aggregate_phase_breakdown(
+                recent_30,
+                prev_30,
+                current_issue_keys=issue_keys,
+                previous_issue_keys=prev_issue_keys,
+            ),
+            "trend_cards": build_trend_cards(df, changes=stats["mom_change"]),
         },
         "samples": {
             "recent_quotes": extract_quotes(recent_30, limit=2),
@@ -725,35 +1136,43 @@ def build_report(df: pd.DataFrame) -> Dict[str, Any]:
         },
     }
 
-    # Serialize timestamps in trend cards if any numeric issues exist.
-    return convert_timestamps(report)
+    return report
 
 
-def convert_timestamps(payload: Dict[str, Any]) -> Dict[str, Any]:
-    """Recursively converts pandas/Datetime objects to ISO strings."""
-    def convert(value: Any) -> Any:
-        if isinstance(value, pd.Timestamp):
-            if pd.isna(value):
-                return None
-            return value.isoformat()
-        if isinstance(value, datetime):
-            return value.isoformat()
-        if isinstance(value, dict):
-            return {k: convert(v) for k, v in value.items()}
-        if isinstance(value, list):
-            return [convert(item) for item in value]
-        return value
-
-    return convert(payload)
+def _json_default(value: Any) -> Any:
+    """Serializes values orjson does not handle natively (pd.Timestamp)."""
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
 
 
 def save_report(report: Dict[str, Any], path: Path) -> None:
     """Writes the report payload to disk as JSON."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+    path.write_bytes(
+        orjson.dumps(
+            report,
+            default=_json_default,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    )
     print(f"Report saved to {path}")
 
 
+def run_export(report_path: Path, df: Optional[pd.DataFrame] = None) -> None:
+    """Builds the report from Sheets rows (or a prefetched ``df``) and saves it."""
+    if df is None:
+        load_environment()
+        df = fetch_raw_data()
+    if df.empty:
+        print("No data available to process.")
+        return
+
+    save_report(build_report(df), report_path)
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Fetch VOC data from Google Sheets and run analyses."
@@ -790,6 +1209,11 @@ def parse_args() -> argparse.Namespace:
         default=3,
         help="Number of rows to display when using --fetch-only (default: 3).",
     )
+    parser.add_argument(
+        "--force-refresh",
+        action="store_true",
+        help="Ignore the local Sheets cache and read rows from the API.",
+    )
     return parser.parse_args()
 
 
@@ -798,7 +1222,7 @@ def main() -> None:
     args = parse_args()
 
     if args.fetch_only:
-        print_sample_rows(limit=args.limit)
+        print_sample_rows(limit=args.limit, force_refresh=args.force_refresh)
         return
     if not (args.stats or args.export_report or args.show_top_issues):
         print(
@@ -806,32 +1230,33 @@ def main() -> None:
         )
         return
 
-    df = fetch_raw_data()
+    df = fetch_raw_data(force_refresh=args.force_refresh)
     if df.empty:
         print("No data available to process.")
         return
 
+    windows = compute_recent_windows_kst(df)
+
     if args.stats:
-        stats = summarise_stats(df)
-        print(pd.Series(stats).to_markdown())
+        stats = summarise_stats(df, windows=windows)
+        for key, value in stats.items():
+            print(f"{key}\t{value}")
 
     if args.show_top_issues:
-        windows = compute_recent_windows_kst(df)
         recent_30 = windows["recent_30d"]
         prev_30 = windows["prev_30d"]
         top_rows = summarize_top_issues(recent_30, prev_30, limit=5)
         if not top_rows:
             print("No issues found in the recent 30-day window.")
         else:
-            print(pd.DataFrame(top_rows).to_markdown(index=False))
+            print(pd.DataFrame(top_rows).to_string(index=False, max_colwidth=80))
 
     if args.export_report:
-        report = build_report(df)
         report_path = Path(
             args.report_path
             or os.environ.get("REPORT_OUTPUT_PATH", str(DEFAULT_REPORT_PATH))
         )
-        save_report(report, report_path)
+        run_export(report_path, df=df)
 
 
 if __name__ == "__main__":
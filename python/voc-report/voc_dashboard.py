@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any, Dict, List
 
+import orjson
 import pandas as pd
 import streamlit as st
 
 DEFAULT_REPORT_PATH = Path(__file__).resolve().parent / "voc_report.json"
 
 
+@st.cache_data(max_entries=4, show_spinner=False)
+def read_report_json(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is only part of the cache key: a rewritten report is re-read.
+    return orjson.loads(Path(path_str).read_bytes())
+
+
 def load_report(path: Path = DEFAULT_REPORT_PATH) -> Dict[str, Any]:
     if not path.exists():
         st.warning(
@@ -20,8 +26,8 @@ def load_report(path: Path = DEFAULT_REPORT_PATH) -> Dict[str, Any]:
         )
         return {}
     try:
-        return json.loads(path.read_text())
-    except json.JSONDecodeError as exc:
+        return read_report_json(str(path), path.stat().st_mtime_ns)
+    except orjson.JSONDecodeError as exc:
         st.error(f"Failed to parse report JSON: {exc}")
         return {}
 
@@ -52,29 +58,52 @@ def render_top_issues(issues: List[Dict[str, Any]]) -> None:
         st.info("Top5 이슈 데이터가 없습니다.")
         return
 
-    cols = st.columns(5)
-    for col, issue in zip(cols, issues):
-        change_pct = issue.get("change_pct", 0)
-        emoji = (
-            "🔴" if change_pct >= 30 else "🟡" if change_pct >= 10 else "🟢"
-        )
-        with col:
-            st.markdown(
-                f"**#{issue.get('rank', '?')} {issue.get('issue_key', '기타')}**"
-            )
-            st.metric("30일 건수", issue.get("count", 0))
-            st.metric(
-                "전월 대비",
-                f"{change_pct:+.1f}%",
-                help=f"직전 30일: {issue.get('previous_count', 0)}건",
-            )
-            st.markdown(f"{emoji} 변화 상태")
-            summary = issue.get("summary")
-            if summary:
-                st.caption(summary)
-            quotes = issue.get("quotes", [])
-            for quote in quotes:
-                st.markdown(f"- {quote}")
+    # Only the top issue gets metric cards; the rest share one table.
+    hero, *others = issues
+    render_issue_card(hero)
+    if not others:
+        return
+
+    data = [
+        {
+            "순위": issue.get("rank"),
+            "이슈": issue.get("issue_key"),
+            "건수(30일)": issue.get("count"),
+            "전월 30일": issue.get("previous_count"),
+            "증감률": f"{issue.get('change_pct', 0):+.1f}%",
+            "요약": issue.get("summary"),
+        }
+        for issue in others
+    ]
+    st.dataframe(pd.DataFrame(data), hide_index=True, use_container_width=True)
+    # One markdown element for every remaining quote.
+    lines = []
+    for issue in others:
+        quotes = issue.get("quotes", [])
+        if quotes:
+            lines.append(f"- **#{issue.get('rank', '?')} {issue.get('issue_key')}**")
+            lines.extend(f"  - {quote}" for quote in quotes)
+    if lines:
+        st.markdown("\n".join(lines))
+
+
+def render_issue_card(issue: Dict[str, Any]) -> None:
+    change_pct = issue.get("change_pct", 0)
+    emoji = "🔴" if change_pct >= 30 else "🟡" if change_pct >= 10 else "🟢"
+    st.markdown(f"**#{issue.get('rank', '?')} {issue.get('issue_key', '기타')}**")
+    cols = st.columns(3)
+    cols[0].metric("30일 건수", issue.get("count", 0))
+    cols[1].metric(
+        "전월 대비",
+        f"{change_pct:+.1f}%",
+        help=f"직전 30일: {issue.get('previous_count', 0)}건",
+    )
+    cols[2].markdown(f"{emoji} 변화 상태")
+    summary = issue.get("summary")
+    if summary:
+        st.caption(summary)
+    for quote in issue.get("quotes", []):
+        st.markdown(f"- {quote}")
 
 
 def render_phase_analysis(